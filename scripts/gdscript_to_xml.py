@@ -6,11 +6,99 @@ Parses GDScript files with doc comments (## style) and generates
 XML documentation compatible with Godot's documentation system.
 """
 
+# Single-file runs are dominated by interpreter startup, so module-level
+# imports stay limited to what every run needs; heavier machinery such as
+# concurrent.futures is imported where it is used.
+import os
 import re
-import xml.etree.ElementTree as ET
-from xml.dom import minidom
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import Iterable, List, Dict, Optional, Tuple
+
+
+# Declaration patterns, compiled once at import rather than looked up in the
+# re module cache on every line. They match str, not bytes: GDScript allows
+# non-ASCII identifiers, which a bytes \w would not match.
+_CLASS_NAME_RE = re.compile(r'class_name\s+(\w+)')
+_SIGNAL_RE = re.compile(r'signal\s+(\w+)(\(.*?\))?')
+_FUNC_RE = re.compile(r'func\s+(\w+)\s*\((.*?)\)\s*(?:->\s*(\w+))?')
+_VAR_RE = re.compile(r'(?:@export\s+)?var\s+(\w+)(?:\s*:\s*(\w+))?(?:\s*=\s*(.+?))?(?:\s*#.*)?$')
+_CONST_RE = re.compile(r'const\s+(\w+)(?:\s*:\s*(\w+))?\s*=\s*(.+?)(?:\s*#.*)?$')
+
+# Declaration handler for each leading keyword. A line is classified by its
+# first word with one dict lookup, and each handler runs only its own
+# pattern, so at most one regex runs per line. That leaves nothing for a
+# multi-pattern engine such as re2.Set to save, and google-re2 matched these
+# short lines slower than re.
+_DISPATCH = {
+    'signal': '_parse_signal',
+    'func': '_parse_method',
+    'var': '_parse_member',
+    '@export': '_parse_member',
+    'const': '_parse_constant',
+}
+
+# Each keyword followed by whitespace. Lines are checked against these
+# before any other work, since most lines are not declarations.
+_DECL_PREFIXES = tuple(keyword + space for keyword in _DISPATCH for space in (' ', '\t'))
+
+# Private methods that are still documented
+_SPECIAL_METHODS = frozenset(('_ready', '_process', '_physics_process', '_input', '_unhandled_input'))
+
+
+# Parsed records use __slots__ so a file with hundreds of declarations does
+# not carry a __dict__ per record.
+class Param:
+    """A signal or method parameter."""
+    __slots__ = ('name', 'type', 'default')
+    
+    def __init__(self, name: str, type: str, default: Optional[str]):
+        self.name = name
+        self.type = type
+        self.default = default
+
+
+class Signal:
+    """A documented signal."""
+    __slots__ = ('name', 'params', 'description')
+    
+    def __init__(self, name: str, params: List[Param], description: str):
+        self.name = name
+        self.params = params
+        self.description = description
+
+
+class Method:
+    """A documented method."""
+    __slots__ = ('name', 'params', 'return_type', 'description')
+    
+    def __init__(self, name: str, params: List[Param], return_type: str, description: str):
+        self.name = name
+        self.params = params
+        self.return_type = return_type
+        self.description = description
+
+
+class Member:
+    """A documented member variable."""
+    __slots__ = ('name', 'type', 'default', 'description', 'exported')
+    
+    def __init__(self, name: str, type: str, default: Optional[str], description: str, exported: bool):
+        self.name = name
+        self.type = type
+        self.default = default
+        self.description = description
+        self.exported = exported
+
+
+class Constant:
+    """A documented constant."""
+    __slots__ = ('name', 'type', 'value', 'description')
+    
+    def __init__(self, name: str, type: str, value: str, description: str):
+        self.name = name
+        self.type = type
+        self.value = value
+        self.description = description
 
 
 class GDScriptParser:
@@ -18,13 +106,11 @@ class GDScriptParser:
     
     def __init__(self, filepath: str):
         self.filepath = Path(filepath)
-        self.content = self.filepath.read_text(encoding='utf-8')
-        self.lines = self.content.split('\n')
         
     def parse(self) -> Dict:
         """Parse the GDScript file and extract documentation."""
         doc = {
-            'class_name': self._get_class_name(),
+            'class_name': '',
             'brief_description': '',
             'description': '',
             'methods': [],
@@ -33,8 +119,16 @@ class GDScriptParser:
             'constants': []
         }
         
-        # Extract class-level documentation
-        class_docs = self._extract_class_docs()
+        # Extract class name, signals, methods, member variables and
+        # constants, streaming the file rather than holding all its lines
+        with open(self.filepath, encoding='utf-8') as f:
+            class_docs = self._parse_all(doc, f)
+        
+        # Fall back to filename without extension
+        if not doc['class_name']:
+            doc['class_name'] = self.filepath.stem
+        
+        # Split class-level documentation
         if class_docs:
             lines = class_docs.strip().split('\n')
             if lines:
@@ -42,203 +136,158 @@ class GDScriptParser:
                 if len(lines) > 1:
                     doc['description'] = '\n'.join(lines[1:]).strip()
         
-        # Extract signals
-        doc['signals'] = self._extract_signals()
-        
-        # Extract methods
-        doc['methods'] = self._extract_methods()
-        
-        # Extract member variables
-        doc['members'] = self._extract_members()
-        
-        # Extract constants
-        doc['constants'] = self._extract_constants()
-        
         return doc
     
-    def _get_class_name(self) -> str:
-        """Extract class name from the file."""
-        # Try to find class_name declaration
-        for line in self.lines:
-            match = re.match(r'class_name\s+(\w+)', line.strip())
-            if match:
-                return match.group(1)
-        
-        # Fall back to filename without extension
-        return self.filepath.stem
-    
-    def _extract_class_docs(self) -> str:
-        """Extract class-level documentation comments."""
-        docs = []
+    def _parse_all(self, doc: Dict, lines: Iterable[str]) -> str:
+        """Fill doc from a single pass over lines and return the class-level documentation."""
+        handlers = {keyword: getattr(self, name) for keyword, name in _DISPATCH.items()}
+        class_docs = []
         in_class_doc = False
         found_extends = False
+        class_docs_done = False
+        pending_docs = []
+        prev_was_export = False
         
-        for idx, line in enumerate(self.lines):
+        for line in lines:
             stripped = line.strip()
             
+            # Remember whether this line is an @export annotation for a var
+            # declared on the next line
+            after_export = prev_was_export
+            prev_was_export = stripped.startswith('@export')
+            
+            # Collect consecutive ## comments for the next declaration, and
+            # for the class once extends has been seen
+            if stripped.startswith('##'):
+                # The line is already stripped on the right
+                doc_text = stripped[2:].lstrip()
+                pending_docs.append(doc_text)
+                if found_extends and not class_docs_done:
+                    in_class_doc = True
+                    class_docs.append(doc_text)
+                continue
+            
+            # Any other line ends the doc block; only a block directly
+            # above a declaration documents it
+            docs = pending_docs
+            if docs:
+                pending_docs = []
+            
+            # A blank line can only end doc blocks, so skip the other checks
+            if not stripped:
+                if in_class_doc:
+                    in_class_doc = False
+                    class_docs_done = True
+                continue
+            
             # Track when we've seen extends
-            if stripped.startswith('extends') or stripped.startswith('class_name'):
+            if stripped.startswith(('extends', 'class_name')):
                 found_extends = True
+                if not doc['class_name'] and stripped.startswith('class_name'):
+                    match = _CLASS_NAME_RE.match(stripped)
+                    if match:
+                        doc['class_name'] = match.group(1)
                 continue
             
-            # Start collecting docs after extends
-            if found_extends and stripped.startswith('##'):
-                in_class_doc = True
-                # Remove ## and leading/trailing whitespace
-                doc_text = stripped[2:].strip()
-                docs.append(doc_text)
-            elif in_class_doc and stripped.startswith('##'):
-                # Continue collecting consecutive ## comments
-                doc_text = stripped[2:].strip()
-                docs.append(doc_text)
-            elif in_class_doc and stripped == '':
-                # Empty line ends class documentation
-                break
-            elif in_class_doc and stripped and not stripped.startswith('#'):
-                # Stop when we hit actual code (signal, var, func, etc)
-                break
-        
-        return '\n'.join(docs)
-    
-    def _extract_doc_comment(self, line_idx: int) -> str:
-        """Extract documentation comment immediately above a given line index."""
-        docs = []
-        idx = line_idx - 1
-        blank_line_seen = False
-        
-        # Look backwards for doc comments (only consecutive ones)
-        while idx >= 0:
-            line = self.lines[idx].strip()
-            if line.startswith('##'):
-                # If we saw a blank line, stop here (docs aren't consecutive)
-                if blank_line_seen:
-                    break
-                doc_text = line[2:].strip()
-                docs.insert(0, doc_text)
-                idx -= 1
-            elif line == '':
-                # Mark that we've seen a blank line, but continue for one more check
-                blank_line_seen = True
-                idx -= 1
-            else:
-                # Non-doc, non-empty line
-                break
-        
-        return '\n'.join(docs)
-    
-    def _extract_signals(self) -> List[Dict]:
-        """Extract signal definitions with their documentation."""
-        signals = []
-        
-        for idx, line in enumerate(self.lines):
-            match = re.match(r'signal\s+(\w+)(\(.*?\))?', line.strip())
-            if match:
-                signal_name = match.group(1)
-                params_str = match.group(2) or '()'
-                
-                # Parse parameters
-                params = self._parse_parameters(params_str)
-                
-                # Get documentation
-                doc = self._extract_doc_comment(idx)
-                
-                signals.append({
-                    'name': signal_name,
-                    'params': params,
-                    'description': doc
-                })
-        
-        return signals
-    
-    def _extract_methods(self) -> List[Dict]:
-        """Extract method definitions with their documentation."""
-        methods = []
-        
-        for idx, line in enumerate(self.lines):
-            # Match function declarations
-            match = re.match(r'func\s+(\w+)\s*\((.*?)\)\s*(?:->\s*(\w+))?', line.strip())
-            if match:
-                method_name = match.group(1)
-                params_str = match.group(2) or ''
-                return_type = match.group(3) or 'void'
-                
-                # Skip private methods (starting with _) unless they're special like _ready
-                if method_name.startswith('_') and method_name not in ['_ready', '_process', '_physics_process', '_input', '_unhandled_input']:
-                    continue
-                
-                # Parse parameters
-                params = self._parse_parameters(f'({params_str})')
-                
-                # Get documentation
-                doc = self._extract_doc_comment(idx)
-                
-                methods.append({
-                    'name': method_name,
-                    'params': params,
-                    'return_type': return_type,
-                    'description': doc
-                })
-        
-        return methods
-    
-    def _extract_members(self) -> List[Dict]:
-        """Extract member variable definitions."""
-        members = []
-        
-        for idx, line in enumerate(self.lines):
-            # Match var declarations
-            match = re.match(r'(?:@export\s+)?var\s+(\w+)(?:\s*:\s*(\w+))?(?:\s*=\s*(.+?))?(?:\s*#.*)?$', line.strip())
-            if match:
-                var_name = match.group(1)
-                var_type = match.group(2) or 'Variant'
-                default_value = match.group(3)
-                
-                # Skip private variables
-                if var_name.startswith('_'):
-                    continue
-                
-                # Get documentation
-                doc = self._extract_doc_comment(idx)
-                
-                # Check for @export
-                is_exported = '@export' in self.lines[max(0, idx-1)] or '@export' in line
-                
-                members.append({
-                    'name': var_name,
-                    'type': var_type,
-                    'default': default_value,
-                    'description': doc,
-                    'exported': is_exported
-                })
-        
-        return members
-    
-    def _extract_constants(self) -> List[Dict]:
-        """Extract constant definitions."""
-        constants = []
-        
-        for idx, line in enumerate(self.lines):
-            # Match const declarations
-            match = re.match(r'const\s+(\w+)(?:\s*:\s*(\w+))?\s*=\s*(.+?)(?:\s*#.*)?$', line.strip())
-            if match:
-                const_name = match.group(1)
-                const_type = match.group(2) or 'Variant'
-                const_value = match.group(3)
-                
-                # Get documentation
-                doc = self._extract_doc_comment(idx)
-                
-                constants.append({
-                    'name': const_name,
-                    'type': const_type,
-                    'value': const_value,
-                    'description': doc
-                })
-        
-        return constants
-    
-    def _parse_parameters(self, params_str: str) -> List[Dict]:
-        """Parse parameter string into list of parameter dictionaries."""
+            # An empty line or actual code (signal, var, func, etc) ends
+            # class documentation; single # comments do not
+            if in_class_doc and not stripped.startswith('#'):
+                in_class_doc = False
+                class_docs_done = True
+            
+            # Most lines are not declarations; reject them with one
+            # startswith() before classifying the rest by leading keyword
+            if not stripped.startswith(_DECL_PREFIXES):
+                continue
+            handler = handlers[stripped.split(None, 1)[0]]
+            
+            # A var counts as exported with @export inline or on the line above
+            handler(doc, stripped, docs, after_export or prev_was_export)
+        
+        return '\n'.join(class_docs)
+    
+    def _parse_signal(self, doc: Dict, stripped: str, docs: List[str], exported: bool) -> None:
+        """Add a signal declared on this line."""
+        match = _SIGNAL_RE.match(stripped)
+        if not match:
+            return
+        
+        signal_name = match.group(1)
+        params_str = match.group(2) or '()'
+        
+        doc['signals'].append(Signal(
+            name=signal_name,
+            params=self._parse_parameters(params_str),
+            description='\n'.join(docs)
+        ))
+    
+    def _parse_method(self, doc: Dict, stripped: str, docs: List[str], exported: bool) -> None:
+        """Add a method declared on this line."""
+        # Skip private methods (starting with _) unless they're special
+        # like _ready; the name is sliced out so this needs no regex
+        method_name = stripped[4:].lstrip().partition('(')[0].rstrip()
+        if method_name.startswith('_') and method_name not in _SPECIAL_METHODS:
+            return
+        
+        # Match function declarations
+        match = _FUNC_RE.match(stripped)
+        if not match:
+            return
+        
+        method_name = match.group(1)
+        params_str = match.group(2) or ''
+        return_type = match.group(3) or 'void'
+        
+        doc['methods'].append(Method(
+            name=method_name,
+            params=self._parse_parameters(f'({params_str})'),
+            return_type=return_type,
+            description='\n'.join(docs)
+        ))
+    
+    def _parse_member(self, doc: Dict, stripped: str, docs: List[str], exported: bool) -> None:
+        """Add a member variable declared on this line."""
+        # Match var declarations
+        match = _VAR_RE.match(stripped)
+        if not match:
+            return
+        
+        var_name = match.group(1)
+        var_type = match.group(2) or 'Variant'
+        default_value = match.group(3)
+        
+        # Skip private variables
+        if var_name.startswith('_'):
+            return
+        
+        doc['members'].append(Member(
+            name=var_name,
+            type=var_type,
+            default=default_value,
+            description='\n'.join(docs),
+            exported=exported
+        ))
+    
+    def _parse_constant(self, doc: Dict, stripped: str, docs: List[str], exported: bool) -> None:
+        """Add a constant declared on this line."""
+        # Match const declarations
+        match = _CONST_RE.match(stripped)
+        if not match:
+            return
+        
+        const_name = match.group(1)
+        const_type = match.group(2) or 'Variant'
+        const_value = match.group(3)
+        
+        doc['constants'].append(Constant(
+            name=const_name,
+            type=const_type,
+            value=const_value,
+            description='\n'.join(docs)
+        ))
+    
+    def _parse_parameters(self, params_str: str) -> List[Param]:
+        """Parse parameter string into list of parameters."""
         params = []
         
         # Remove parentheses
@@ -255,21 +304,52 @@ class GDScriptParser:
                 continue
             
             # Parse parameter: name: type = default
-            match = re.match(r'(\w+)(?:\s*:\s*(\w+))?(?:\s*=\s*(.+))?', part)
-            if match:
-                param_name = match.group(1)
-                param_type = match.group(2) or 'Variant'
-                param_default = match.group(3)
-                
-                params.append({
-                    'name': param_name,
-                    'type': param_type,
-                    'default': param_default
-                })
+            name_type, has_default, param_default = part.partition('=')
+            param_name, _, param_type = name_type.partition(':')
+            param_name = param_name.strip()
+            if not param_name:
+                continue
+            
+            params.append(Param(
+                name=param_name,
+                type=param_type.strip() or 'Variant',
+                default=param_default.strip() if has_default else None
+            ))
         
         return params
 
 
+# The class XML layout is fixed, so it is written directly as indented text
+# rather than built as an element tree first. Only the class name varies in
+# the opening lines.
+_CLASS_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8" ?>\n'
+    '<class name="{name}" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"'
+    ' xsi:noNamespaceSchemaLocation="../class.xsd">\n'
+)
+
+
+# Escaping is done with str.replace, as ElementTree does, rather than with
+# xml.sax.saxutils: importing that pulls in urllib and costs more at startup
+# than converting a typical script.
+def _escape(text: str) -> str:
+    """Escape XML character data."""
+    return text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+
+def _attr(value: str) -> str:
+    """Escape a string for use as a double-quoted XML attribute value."""
+    return (_escape(value).replace('"', '&quot;')
+            .replace('\r', '&#13;').replace('\n', '&#10;').replace('\t', '&#09;'))
+
+
+def _leaf(indent: str, tag: str, attrs: str, text: str) -> str:
+    """Return one indented element line, self-closing when it has no text."""
+    if text:
+        return f'{indent}<{tag}{attrs}>{_escape(text)}</{tag}>\n'
+    return f'{indent}<{tag}{attrs} />\n'
+
+
 class GodotXMLGenerator:
     """Generates Godot XML documentation from parsed GDScript data."""
     
@@ -278,112 +358,83 @@ class GodotXMLGenerator:
         
     def generate(self) -> str:
         """Generate XML documentation string."""
-        root = ET.Element('class')
-        root.set('name', self.data['class_name'])
-        root.set('xmlns:xsi', 'http://www.w3.org/2001/XMLSchema-instance')
-        root.set('xsi:noNamespaceSchemaLocation', '../class.xsd')
+        out = [_CLASS_HEADER.format(name=_attr(self.data['class_name']))]
         
         # Brief description
-        brief = ET.SubElement(root, 'brief_description')
-        brief.text = self.data['brief_description']
+        out.append(_leaf('  ', 'brief_description', '', self.data['brief_description']))
         
         # Description
-        description = ET.SubElement(root, 'description')
-        description.text = self.data['description']
+        out.append(_leaf('  ', 'description', '', self.data['description']))
         
         # Tutorials (empty for now)
-        ET.SubElement(root, 'tutorials')
-        
-        # Methods
-        if self.data['methods']:
-            methods = ET.SubElement(root, 'methods')
-            for method in self.data['methods']:
-                self._add_method(methods, method)
-        
-        # Signals
-        if self.data['signals']:
-            signals = ET.SubElement(root, 'signals')
-            for signal in self.data['signals']:
-                self._add_signal(signals, signal)
-        
-        # Members
-        if self.data['members']:
-            members = ET.SubElement(root, 'members')
-            for member in self.data['members']:
-                self._add_member(members, member)
-        
-        # Constants
-        if self.data['constants']:
-            constants = ET.SubElement(root, 'constants')
-            for constant in self.data['constants']:
-                self._add_constant(constants, constant)
-        
-        # Convert to pretty XML string
-        return self._prettify(root)
-    
-    def _add_method(self, parent: ET.Element, method: Dict) -> None:
+        out.append('  <tutorials />\n')
+        
+        # Methods, signals, members and constants, each omitted when empty
+        sections = (
+            ('methods', self._add_method),
+            ('signals', self._add_signal),
+            ('members', self._add_member),
+            ('constants', self._add_constant),
+        )
+        for tag, add in sections:
+            items = self.data[tag]
+            if items:
+                out.append(f'  <{tag}>\n')
+                for item in items:
+                    add(out, item)
+                out.append(f'  </{tag}>\n')
+        
+        out.append('</class>\n')
+        return ''.join(out)
+    
+    def _add_method(self, out: List[str], method: Method) -> None:
         """Add a method element."""
-        method_elem = ET.SubElement(parent, 'method')
-        method_elem.set('name', method['name'])
+        out.append(f'    <method name="{_attr(method.name)}">\n')
         
         # Return type
-        return_elem = ET.SubElement(method_elem, 'return')
-        return_elem.set('type', method['return_type'])
+        out.append(f'      <return type="{_attr(method.return_type)}" />\n')
         
         # Parameters
-        for param in method['params']:
-            param_elem = ET.SubElement(method_elem, 'param')
-            param_elem.set('index', str(method['params'].index(param)))
-            param_elem.set('name', param['name'])
-            param_elem.set('type', param['type'])
-            if param['default']:
-                param_elem.set('default', param['default'])
+        for i, param in enumerate(method.params):
+            default = f' default="{_attr(param.default)}"' if param.default else ''
+            out.append(
+                f'      <param index="{i}" name="{_attr(param.name)}"'
+                f' type="{_attr(param.type)}"{default} />\n'
+            )
         
         # Description
-        desc_elem = ET.SubElement(method_elem, 'description')
-        desc_elem.text = method['description']
+        out.append(_leaf('      ', 'description', '', method.description))
+        out.append('    </method>\n')
     
-    def _add_signal(self, parent: ET.Element, signal: Dict) -> None:
+    def _add_signal(self, out: List[str], signal: Signal) -> None:
         """Add a signal element."""
-        signal_elem = ET.SubElement(parent, 'signal')
-        signal_elem.set('name', signal['name'])
+        out.append(f'    <signal name="{_attr(signal.name)}">\n')
         
         # Parameters
-        for param in signal['params']:
-            param_elem = ET.SubElement(signal_elem, 'param')
-            param_elem.set('index', str(signal['params'].index(param)))
-            param_elem.set('name', param['name'])
-            param_elem.set('type', param['type'])
+        for i, param in enumerate(signal.params):
+            out.append(
+                f'      <param index="{i}" name="{_attr(param.name)}"'
+                f' type="{_attr(param.type)}" />\n'
+            )
         
         # Description
-        desc_elem = ET.SubElement(signal_elem, 'description')
-        desc_elem.text = signal['description']
+        out.append(_leaf('      ', 'description', '', signal.description))
+        out.append('    </signal>\n')
     
-    def _add_member(self, parent: ET.Element, member: Dict) -> None:
+    def _add_member(self, out: List[str], member: Member) -> None:
         """Add a member element."""
-        member_elem = ET.SubElement(parent, 'member')
-        member_elem.set('name', member['name'])
-        member_elem.set('type', member['type'])
-        if member['default']:
-            member_elem.set('default', member['default'])
+        default = f' default="{_attr(member.default)}"' if member.default else ''
+        attrs = f' name="{_attr(member.name)}" type="{_attr(member.type)}"{default}'
         
         # Description
-        member_elem.text = member['description']
+        out.append(_leaf('    ', 'member', attrs, member.description))
     
-    def _add_constant(self, parent: ET.Element, constant: Dict) -> None:
+    def _add_constant(self, out: List[str], constant: Constant) -> None:
         """Add a constant element."""
-        const_elem = ET.SubElement(parent, 'constant')
-        const_elem.set('name', constant['name'])
-        const_elem.set('value', constant['value'])
+        attrs = f' name="{_attr(constant.name)}" value="{_attr(constant.value)}"'
         
         # Description
-        const_elem.text = constant['description']
-    
-    def _prettify(self, elem: ET.Element) -> str:
-        """Return a pretty-printed XML string."""
-        rough_string = ET.tostring(elem, encoding='unicode')
-        reparsed = minidom.parseString(rough_string)
-        return reparsed.toprettyxml(indent='  ')
+        out.append(_leaf('    ', 'constant', attrs, constant.description))
 
 
 def convert_gdscript_to_xml(gdscript_path: str, output_path: Optional[str] = None) -> str:
@@ -413,22 +464,124 @@ def convert_gdscript_to_xml(gdscript_path: str, output_path: Optional[str] = Non
     return xml_content
 
 
+def _convert_to_file(gdscript_path: Path, output_path: Path) -> None:
+    """Convert one file in a worker process without sending the XML back."""
+    convert_gdscript_to_xml(gdscript_path, output_path)
+
+
+def convert_many(paths: List[Path], out_dir: Path, jobs: Optional[int] = None) -> List[Path]:
+    """
+    Convert several GDScript files to Godot XML documentation.
+    
+    Files are independent, so they are converted in a process pool rather
+    than paying interpreter startup once per file.
+    
+    Args:
+        paths: Paths to the .gd files; a file listed more than once is
+            converted once
+        out_dir: Directory to save the XML files in, as <input-file-name>.xml
+        jobs: Number of worker processes (defaults to the CPU count)
+    
+    Returns:
+        The paths of the generated XML files, in input order of first
+        appearance
+    
+    Raises:
+        ValueError: If two inputs share a file name and would be saved to
+            the same XML file
+    """
+    # The same script can be reached twice, e.g. through its directory and
+    # by name; that is one source, not two that clash
+    unique_paths: Dict[Path, Path] = {}
+    for path in paths:
+        unique_paths.setdefault(Path(path).resolve(), Path(path))
+    paths = list(unique_paths.values())
+    
+    if not paths:
+        return []
+    
+    out_dir = Path(out_dir)
+    output_paths = [out_dir / f"{Path(path).stem}.xml" for path in paths]
+    
+    # Scripts with the same name in different folders would overwrite each
+    # other, and with a pool the survivor would depend on scheduling
+    inputs_by_output: Dict[Path, List[Path]] = {}
+    for path, output_path in zip(paths, output_paths):
+        inputs_by_output.setdefault(output_path, []).append(path)
+    conflicts = [inputs for inputs in inputs_by_output.values() if len(inputs) > 1]
+    if conflicts:
+        details = '; '.join(', '.join(str(path) for path in inputs) for inputs in conflicts)
+        raise ValueError(f"Inputs would overwrite each other's XML in {out_dir}: {details}")
+    
+    out_dir.mkdir(exist_ok=True)
+    
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    jobs = min(jobs, len(paths))
+    
+    # A pool only pays off with more than one file and worker
+    if jobs <= 1:
+        for path, output_path in zip(paths, output_paths):
+            _convert_to_file(path, output_path)
+    else:
+        # Imported here: the pool machinery is only needed for batches
+        from concurrent.futures import ProcessPoolExecutor
+        
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            # Consume the results so worker exceptions are raised here
+            list(executor.map(_convert_to_file, paths, output_paths))
+    
+    return output_paths
+
+
 if __name__ == '__main__':
     import sys
     
     if len(sys.argv) < 2:
-        print("Usage: python gdscript_to_xml.py <gdscript_file>")
+        print("Usage: python gdscript_to_xml.py <gdscript_file_or_directory> [...]")
         sys.exit(1)
     
-    input_file = sys.argv[1]
+    # Group inputs by the doc_classes directory they are saved to: a file
+    # goes next to itself, a directory collects every .gd file below it.
+    # A script reached more than once is only converted the first time.
+    batches: Dict[Path, List[Path]] = {}
+    seen = set()
+    missing = False
+    for arg in sys.argv[1:]:
+        input_path = Path(arg)
+        if input_path.is_dir():
+            found = sorted(input_path.rglob('*.gd'))
+            if not found:
+                print(f"No .gd files found in {input_path}", file=sys.stderr)
+                continue
+            docs_dir = input_path / 'doc_classes'
+        elif input_path.is_file():
+            found = [input_path]
+            docs_dir = input_path.parent / 'doc_classes'
+        else:
+            # Skip mistyped paths rather than creating doc_classes/ for them
+            print(f"No such file: {input_path}", file=sys.stderr)
+            missing = True
+            continue
+        
+        for path in found:
+            resolved = path.resolve()
+            if resolved not in seen:
+                seen.add(resolved)
+                batches.setdefault(docs_dir, []).append(path)
     
-    # Create docs directory if it doesn't exist
-    docs_dir = Path(input_file).parent / 'doc_classes'
-    docs_dir.mkdir(exist_ok=True)
+    if not batches:
+        sys.exit(1)
     
-    # Always save to docs/<input-file-name>.xml
-    input_filename = Path(input_file).stem
-    output_file = docs_dir / f"{input_filename}.xml"
+    # Always save to doc_classes/<input-file-name>.xml
+    for docs_dir, paths in batches.items():
+        try:
+            output_files = convert_many(paths, docs_dir)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        for output_file in output_files:
+            print(f"Generated XML documentation: {output_file}")
     
-    xml = convert_gdscript_to_xml(input_file, output_file)
-    print(f"Generated XML documentation: {output_file}")
+    if missing:
+        sys.exit(1)